@@ -10,18 +10,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import select
 import sys
 import threading
-import tty
-import termios
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from orchestrator.utils.fast_json import json_loads
 
 # 라이브러리 로그 억제
 logging.basicConfig(level=logging.WARNING)
@@ -41,9 +39,7 @@ SEL2  = '\033[48;5;24m'    # 옵션 선택 배경 (dark blue)
 
 def _hide_cursor():  sys.stdout.write('\033[?25l'); sys.stdout.flush()
 def _show_cursor():  sys.stdout.write('\033[?25h'); sys.stdout.flush()
-def _home():         sys.stdout.write('\033[H');    sys.stdout.flush()
 def _clear():        sys.stdout.write('\033[2J\033[H'); sys.stdout.flush()
-def _clear_below():  sys.stdout.write('\033[J');    sys.stdout.flush()
 
 
 # ─── CJK 문자폭 ──────────────────────────────────────────────────────────────
@@ -72,50 +68,249 @@ def _pad(s: str, width: int) -> str:
 
 # ─── 키 입력 ─────────────────────────────────────────────────────────────────
 
+_ARROW_KEYS = {b'A': 'UP', b'B': 'DOWN', b'C': 'RIGHT', b'D': 'LEFT'}
+
+_CONTROL_KEYS = {
+    b'\r':   'ENTER',
+    b'\n':   'ENTER',
+    b'\x03': 'CTRL_C',
+    b'\x7f': 'BACKSPACE',
+    b'\x08': 'BACKSPACE',
+    b'\t':   'TAB',
+}
+
+
 class KeyReader:
-    """원시(raw) 터미널 키 입력 리더."""
+    """원시(raw) 터미널 키 입력 리더.
+
+    입력은 가능한 만큼 한 번에 읽어 내부 버퍼에 두고 키 단위로 꺼낸다.
+    붙여넣기처럼 여러 바이트가 한꺼번에 들어와도 read 호출은 한 번이며,
+    UTF-8 멀티바이트 문자(한글 등)도 온전한 문자로 반환된다.
+    """
+
+    def __init__(self):
+        self._buf = b''
+        self._saved = None  # start() 이전 터미널 설정
+
+    @property
+    def pending(self) -> bool:
+        """이미 읽혀 버퍼에 남은 입력이 있는지."""
+        return bool(self._buf)
+
+    def _fill(self, fd: int, n: int) -> bool:
+        """버퍼에 최소 n바이트가 있도록 짧게 대기하며 읽는다."""
+        while len(self._buf) < n:
+            r, _, _ = select.select([fd], [], [], 0.05)
+            if not r:
+                return False
+            self._buf += os.read(fd, 4096)
+        return True
+
+    def _take(self, n: int) -> bytes:
+        chunk, self._buf = self._buf[:n], self._buf[n:]
+        return chunk
+
+    def start(self):
+        """raw 모드 진입. stop()까지 유지되어 키마다 tty를 재설정하지 않는다."""
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        if self._saved is not None or not os.isatty(fd):
+            return
+        self._saved = termios.tcgetattr(fd)
+        tty.setraw(fd)
+        # 출력 후처리(\n -> \r\n)는 유지해야 화면이 정상적으로 그려진다
+        mode = termios.tcgetattr(fd)
+        mode[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+
+    def stop(self):
+        """start() 이전의 터미널 설정 복원."""
+        import termios
+
+        if self._saved is None:
+            return
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved)
+        self._saved = None
 
     def read_raw(self) -> str:
         """단일 키 읽기 (블로킹). 키 이름 문자열 반환."""
         fd = sys.stdin.fileno()
+        if self._saved is not None:
+            return self._read_key(fd)
+
+        # start() 없이 호출된 경우: 이 키를 읽는 동안만 raw 모드
+        # (Unix 전용 모듈: --help 등 키 입력이 없는 경로에서는 로드하지 않음)
+        import termios
+        import tty
+
         old = termios.tcgetattr(fd)
         try:
             tty.setraw(fd)
-            ch = os.read(fd, 1)
-
-            if ch == b'\x1b':
-                # 이스케이프 시퀀스 처리 (짧은 타임아웃)
-                r, _, _ = select.select([sys.stdin], [], [], 0.05)
-                if r:
-                    ch2 = os.read(fd, 1)
-                    if ch2 == b'[':
-                        r2, _, _ = select.select([sys.stdin], [], [], 0.05)
-                        if r2:
-                            ch3 = os.read(fd, 1)
-                            if ch3 == b'A': return 'UP'
-                            if ch3 == b'B': return 'DOWN'
-                            if ch3 == b'C': return 'RIGHT'
-                            if ch3 == b'D': return 'LEFT'
-                return 'ESC'
-
-            if ch in (b'\r', b'\n'): return 'ENTER'
-            if ch == b'\x03':        return 'CTRL_C'
-            if ch in (b'\x7f', b'\x08'): return 'BACKSPACE'
-            if ch == b'\t':          return 'TAB'
-
-            try:
-                return ch.decode('utf-8')
-            except Exception:
-                return ''
+            return self._read_key(fd)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old)
 
+    def _read_key(self, fd: int) -> str:
+        """raw 모드에서 키 하나를 읽어 키 이름으로 변환."""
+        if not self._buf:
+            self._buf = os.read(fd, 4096)
+        ch = self._take(1)
+        if not ch:
+            return ''  # EOF / 터미널 끊김
+
+        if ch == b'\x1b':
+            # 이스케이프 시퀀스 처리 (짧은 타임아웃)
+            if self._fill(fd, 1):
+                ch2 = self._take(1)
+                if ch2 == b'[' and self._fill(fd, 1):
+                    return _ARROW_KEYS.get(self._take(1), 'ESC')
+            return 'ESC'
+
+        name = _CONTROL_KEYS.get(ch)
+        if name:
+            return name
+
+        # UTF-8 선행 바이트면 나머지 바이트까지 모아서 디코딩
+        lead = ch[0]
+        n = 4 if lead >= 0xF0 else 3 if lead >= 0xE0 else 2 if lead >= 0xC0 else 1
+        if n > 1 and self._fill(fd, n - 1):
+            ch += self._take(n - 1)
+        try:
+            return ch.decode('utf-8')
+        except Exception:
+            return ''
+
     def read(self, timeout: float = 0.1) -> Optional[str]:
         """논블로킹 읽기. timeout 내 입력 없으면 None 반환."""
+        if self._buf:
+            return self.read_raw()
         r, _, _ = select.select([sys.stdin], [], [], timeout)
         return self.read_raw() if r else None
 
 
+# ─── 작업 이력 ────────────────────────────────────────────────────────────────
+
+def _with_mtime(paths: Iterable[Path]) -> Iterator[Tuple[float, Path]]:
+    """(mtime, path) 쌍. 그 사이 사라진 파일은 건너뛴다."""
+    for path in paths:
+        try:
+            yield os.stat(path).st_mtime, path
+        except OSError:
+            pass
+
+
+def _task_manifests(tasks_dir: str) -> Iterator[Tuple[float, Path]]:
+    """tasks_dir/<task>/manifest.json의 (mtime, path) 쌍.
+
+    task 디렉토리는 한 단계 아래에만 있으므로 재귀 glob 대신
+    scandir로 하위 디렉토리만 훑는다.
+    """
+    try:
+        with os.scandir(tasks_dir) as it:
+            dirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    yield from _with_mtime(Path(d, 'manifest.json') for d in dirs)
+
+
+_STATUS_ROW = '{icon} {task_id}  [{stage}]  {created}'.format
+
+# stage -> (아이콘, 색상)
+_STAGE_STYLE = {
+    'done':    ('✓', GRN),
+    'running': ('●', YLW),
+}
+_STAGE_STYLE_DEFAULT = ('·', DIM)
+
+
+def _read_status_item(manifest: Path) -> Optional[dict]:
+    """manifest.json 하나를 읽어 상태 화면 항목으로 변환. 실패 시 None.
+
+    표시용 label은 로드 시 한 번만 만들어 두고 렌더링마다 재사용한다.
+    """
+    try:
+        data = json_loads(manifest.read_bytes())
+        task_id = data.get('task_id', manifest.parent.name)
+        stage = data.get('stage', '?')
+        created = data.get('created_at', '')
+        icon, color = _STAGE_STYLE.get(stage, _STAGE_STYLE_DEFAULT)
+        return {
+            'task_id': task_id,
+            'stage':   stage,
+            'created': created,
+            'path':    os.fspath(manifest.parent),
+            'color':   color,
+            'label':   _STATUS_ROW(
+                icon=icon,
+                task_id=task_id,
+                stage=stage,
+                created=created[:16].replace('T', ' ') if created else '',
+            ),
+        }
+    except Exception:
+        return None
+
+
+# ─── 기획서 탐색 ─────────────────────────────────────────────────────────────
+
+# 기획서 선택 화면에서 검색하는 위치
+_SPEC_GLOBS = (
+    'workspaces/**/planning/completed/*.md',
+    'workspaces/**/planning/in-progress/*.md',
+    'workspace/planning/completed/*.md',
+    'workspace/planning/in-progress/*.md',
+)
+
+# 기획서가 있을 리 없는 대형 디렉토리는 탐색에서 제외
+_SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.cache', '.venv', 'venv',
+})
+
+
+# (디렉토리, 파일명) -> (mtime_ns, 하위 디렉토리 목록, 파일 존재 여부)
+_dir_cache: Dict[Tuple[str, str], Tuple[int, List[str], bool]] = {}
+
+
+def _find_files(name: str, root: str = '.') -> List[str]:
+    """root 아래에서 이름이 name인 파일을 모두 찾는다 (_SKIP_DIRS 제외).
+
+    디렉토리 mtime은 항목이 추가/삭제/이름 변경될 때만 바뀌므로,
+    이전 탐색 이후 mtime이 그대로인 디렉토리는 목록을 다시 읽지 않고
+    캐시된 결과를 사용한다 (변경 없으면 디렉토리당 stat 한 번).
+    결과는 경로 문자열이며, Path 변환은 실제로 표시할 항목에만 한다.
+    """
+    found: List[str] = []
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            mtime = os.stat(d).st_mtime_ns
+        except OSError:
+            continue
+        cached = _dir_cache.get((d, name))
+        if cached is None or cached[0] != mtime:
+            subdirs: List[str] = []
+            has_file = False
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.is_dir(follow_symlinks=False):
+                            if e.name not in _SKIP_DIRS:
+                                subdirs.append(e.path)
+                        elif e.name == name:
+                            has_file = True
+            except OSError:
+                continue
+            cached = (mtime, subdirs, has_file)
+            _dir_cache[(d, name)] = cached
+        if cached[2]:
+            found.append(os.path.join(d, name))
+        stack.extend(cached[1])
+    return found
+
+
 # ─── 상태 ─────────────────────────────────────────────────────────────────────
 
 ST_MAIN    = 'main'
@@ -148,7 +343,9 @@ class InteractiveCLI:
 
         # 기획서 선택
         self.spec_files: List[Path] = []
+        self.spec_labels: List[str] = []
         self.spec_sel = 0
+        self._spec_rows: Optional[Tuple[int, List[str]]] = None  # (폭, 행)
 
         # 파이프라인
         self.current_spec: Optional[Path] = None
@@ -157,6 +354,13 @@ class InteractiveCLI:
         self._pipeline_result: Optional[dict] = None
         self._pipeline_error: Optional[str] = None
         self._pipeline_start: Optional[float] = None
+        # 실행 간 Orchestrator 재사용 (config mtime, 인스턴스)
+        self._orc_cache: Optional[Tuple[Optional[int], object]] = None
+
+        # 최근 task 디렉토리 캐시 (tasks/ 디렉토리 mtime 커서)
+        self._tasks_dir: Optional[Tuple[object, str]] = None  # (orc, 경로)
+        self._task_cursor: Optional[Tuple[str, int]] = None
+        self._latest_task: Optional[Path] = None
 
         # 질문 UI
         self.q_sel = 0          # 질문 목록 인덱스 (복수 질문 시)
@@ -168,23 +372,47 @@ class InteractiveCLI:
         self.status_items: List[dict] = []
         self.status_sel = 0
 
+        # 직전에 출력한 프레임 (터미널 폭, 내용)
+        self._last_frame: Optional[Tuple[int, str]] = None
+
+        # 상태별 키 처리/화면 그리기 (키 입력·렌더링마다 재구성하지 않도록)
+        self._key_handlers = {
+            ST_MAIN:   self._key_main,
+            ST_SPEC:   self._key_spec,
+            ST_RUN:    self._key_run,
+            ST_DONE:   self._key_done,
+            ST_STATUS: self._key_status,
+        }
+        self._drawers = {
+            ST_MAIN:   self._draw_main,
+            ST_SPEC:   self._draw_spec,
+            ST_RUN:    self._draw_run,
+            ST_DONE:   self._draw_done,
+            ST_STATUS: self._draw_status,
+        }
+
     # ─── 메인 루프 ────────────────────────────────────────────────────────────
 
     def run(self):
         """인터랙티브 루프 시작."""
+        self.keys.start()
         _hide_cursor()
         _clear()
+        self._last_frame = None
         try:
             while self.state != ST_QUIT:
                 key = self.keys.read(timeout=0.1)
-                if key:
+                while key:
                     self._dispatch(key)
+                    # 붙여넣기 등으로 이미 읽힌 입력은 렌더링 전에 모두 처리
+                    key = self.keys.read_raw() if self.keys.pending else None
                 self._render()
         except KeyboardInterrupt:
             pass
         finally:
             _clear()
             _show_cursor()
+            self.keys.stop()
             if self._pipeline_thread and self._pipeline_thread.is_alive():
                 print(f'{YLW}파이프라인이 백그라운드에서 실행 중입니다.{RST}')
 
@@ -194,13 +422,9 @@ class InteractiveCLI:
         if key == 'CTRL_C':
             self.state = ST_QUIT
             return
-        {
-            ST_MAIN:   self._key_main,
-            ST_SPEC:   self._key_spec,
-            ST_RUN:    self._key_run,
-            ST_DONE:   self._key_done,
-            ST_STATUS: self._key_status,
-        }.get(self.state, lambda k: None)(key)
+        handler = self._key_handlers.get(self.state)
+        if handler:
+            handler(key)
 
     def _key_main(self, key: str):
         n = len(MAIN_ITEMS)
@@ -310,27 +534,34 @@ class InteractiveCLI:
 
     def _enter_spec(self):
         """기획서 파일 목록 로드 후 선택 화면으로."""
-        specs: List[Path] = []
-        for pattern in [
-            'workspaces/**/planning/completed/*.md',
-            'workspaces/**/planning/in-progress/*.md',
-            'workspace/planning/completed/*.md',
-            'workspace/planning/in-progress/*.md',
-            'planning-spec.md',
-            '**/planning-spec.md',
-        ]:
-            specs.extend(Path('.').glob(pattern))
+        from concurrent.futures import ThreadPoolExecutor
+
+        # 서로 독립적인 탐색을 병렬로 수행 (디렉토리 I/O 동안 GIL 해제)
+        with ThreadPoolExecutor(max_workers=len(_SPEC_GLOBS) + 1) as ex:
+            walk = ex.submit(_find_files, 'planning-spec.md')
+            globbed = ex.map(
+                lambda pattern: list(Path('.').glob(pattern)), _SPEC_GLOBS,
+            )
+            specs = [spec for found in globbed for spec in found]
+            specs.extend(walk.result())
 
         # 중복 제거, 수정 시간 역순 정렬
-        seen: set = set()
-        unique: List[Path] = []
-        for s in sorted(specs, key=lambda p: p.stat().st_mtime, reverse=True):
-            key = str(s.resolve())
-            if key not in seen:
-                seen.add(key)
-                unique.append(s)
-
-        self.spec_files = unique[:30]
+        # (파일당 stat 한 번: (st_dev, st_ino)로 같은 파일 판별 + mtime)
+        by_inode: Dict[Tuple[int, int], Tuple[float, str | Path]] = {}
+        for spec in specs:
+            try:
+                st = os.stat(spec)
+            except OSError:
+                continue
+            by_inode.setdefault((st.st_dev, st.st_ino), (st.st_mtime, spec))
+        unique = [
+            spec for _, spec in
+            sorted(by_inode.values(), key=lambda v: v[0], reverse=True)
+        ]
+
+        self.spec_files = [Path(spec) for spec in unique[:30]]
+        self.spec_labels = [os.fspath(spec) for spec in self.spec_files]
+        self._spec_rows = None
         self.spec_sel = 0
         self.state = ST_SPEC
 
@@ -347,8 +578,7 @@ class InteractiveCLI:
 
         def _run():
             try:
-                from orchestrator.main import Orchestrator
-                orc = Orchestrator(config_path=self.config_path)
+                orc = self._get_orchestrator()
                 self.orchestrator = orc
                 result = orc.run_from_spec(self.current_spec)
                 self._pipeline_result = result
@@ -361,25 +591,48 @@ class InteractiveCLI:
         self._pipeline_thread = threading.Thread(target=_run, daemon=True)
         self._pipeline_thread.start()
 
+    def _get_orchestrator(self):
+        """Orchestrator 반환. config 파일이 바뀐 경우에만 새로 생성."""
+        from orchestrator.main import Orchestrator
+
+        try:
+            mtime = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._orc_cache is None or self._orc_cache[0] != mtime:
+            self._orc_cache = (
+                mtime, Orchestrator(config_path=self.config_path),
+            )
+        return self._orc_cache[1]
+
     def _enter_status(self):
         """작업 이력 로드."""
+        import heapq
+        from concurrent.futures import ThreadPoolExecutor
+        from itertools import chain
+
+        # 전체 목록을 만들어 정렬하지 않고 최근 20개만 유지
+        manifests = [
+            path for _, path in heapq.nlargest(
+                20,
+                chain(
+                    _with_mtime(
+                        Path('.').glob('workspaces/**/work/**/manifest.json')
+                    ),
+                    _task_manifests('workspace/tasks'),
+                ),
+                key=lambda pair: pair[0],
+            )
+        ]
+
+        # 독립적인 파일 읽기/파싱을 병렬로 수행 (정렬 순서 유지)
         items: List[dict] = []
-        for manifest in sorted(
-            list(Path('.').glob('workspaces/**/work/**/manifest.json')) +
-            list(Path('.').glob('workspace/tasks/**/manifest.json')),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )[:20]:
-            try:
-                data = json.loads(manifest.read_text())
-                items.append({
-                    'task_id': data.get('task_id', manifest.parent.name),
-                    'stage':   data.get('stage', '?'),
-                    'created': data.get('created_at', ''),
-                    'path':    str(manifest.parent),
-                })
-            except Exception:
-                pass
+        if manifests:
+            with ThreadPoolExecutor(max_workers=min(8, len(manifests))) as ex:
+                items = [
+                    item for item in ex.map(_read_status_item, manifests)
+                    if item is not None
+                ]
         self.status_items = items
         self.status_sel = 0
         self.state = ST_STATUS
@@ -387,16 +640,15 @@ class InteractiveCLI:
     # ─── 렌더링 ───────────────────────────────────────────────────────────────
 
     def _render(self):
-        _home()
-        out = {
-            ST_MAIN:   self._draw_main,
-            ST_SPEC:   self._draw_spec,
-            ST_RUN:    self._draw_run,
-            ST_DONE:   self._draw_done,
-            ST_STATUS: self._draw_status,
-        }.get(self.state, lambda: '')()
-        sys.stdout.write(out)
-        _clear_below()
+        draw = self._drawers.get(self.state)
+        out = draw() if draw else ''
+        # 내용과 터미널 폭이 직전 프레임과 같으면 출력 생략
+        frame = (self._term_cols(), out)
+        if frame == self._last_frame:
+            return
+        self._last_frame = frame
+        # 커서 이동 + 화면 + 아래 지우기를 한 번의 write/flush로 출력
+        sys.stdout.write(f'\033[H{out}\033[J')
         sys.stdout.flush()
 
     @staticmethod
@@ -442,16 +694,17 @@ class InteractiveCLI:
             ]
             return '\n'.join(lines)
 
-        for i, spec in enumerate(self.spec_files):
-            try:
-                label = str(spec.relative_to(Path('.')))
-            except ValueError:
-                label = str(spec)
-            label = label[-W:] if len(label) > W else label
+        # 폭 W로 자르고 패딩한 라벨은 W가 바뀔 때만 다시 계산
+        if self._spec_rows is None or self._spec_rows[0] != W:
+            self._spec_rows = (W, [
+                _pad(label[-W:] if len(label) > W else label, W)
+                for label in self.spec_labels
+            ])
+        for i, row in enumerate(self._spec_rows[1]):
             if i == self.spec_sel:
-                lines.append(f'  {SEL}{BOLD}> {_pad(label, W)}  {RST}')
+                lines.append(f'  {SEL}{BOLD}> {row}  {RST}')
             else:
-                lines.append(f'  {DIM}  {_pad(label, W)}{RST}')
+                lines.append(f'  {DIM}  {row}{RST}')
 
         lines += ['', f'  {DIM}↑↓ 이동  ·  Enter 실행  ·  ESC / q 뒤로{RST}']
         return '\n'.join(lines)
@@ -556,15 +809,11 @@ class InteractiveCLI:
             lines.append(f'  {DIM}실행된 작업이 없습니다.{RST}')
         else:
             for i, item in enumerate(self.status_items):
-                stage = item['stage']
-                icon = '✓' if stage == 'done' else '●' if stage == 'running' else '·'
-                col = GRN if stage == 'done' else YLW if stage == 'running' else DIM
-                created = item['created'][:16].replace('T', ' ') if item['created'] else ''
-                label = f'{icon} {item["task_id"]}  [{stage}]  {created}'
+                label = item['label']
                 if i == self.status_sel:
                     lines.append(f'  {SEL}{BOLD}  {_pad(label, 54)}  {RST}')
                 else:
-                    lines.append(f'  {col}  {label}{RST}')
+                    lines.append(f'  {item["color"]}  {label}{RST}')
 
         lines += ['', f'  {DIM}↑↓ 이동  ·  ESC / q 뒤로{RST}']
         return '\n'.join(lines)
@@ -577,42 +826,62 @@ class InteractiveCLI:
         if not orc:
             return f'{DIM}초기화 중...{RST}'
 
-        # manifest.json에서 stage 읽기
+        # stage.txt 우선, 없으면 manifest.json에서 stage 읽기
         try:
-            ws = orc.workspace_root
-            # 가장 최근 task 디렉토리
-            task_dirs = sorted(
-                (ws / 'tasks').glob('task-*'), reverse=True
-            )
-            if task_dirs:
-                manifest = task_dirs[0] / 'manifest.json'
-                if manifest.exists():
-                    data = json.loads(manifest.read_text())
+            task_dir = self._latest_task_dir()
+            if task_dir:
+                try:
+                    stage = (task_dir / 'stage.txt').read_text(encoding='utf-8').strip()
+                except OSError:
+                    stage = ''
+                if not stage:
+                    data = json_loads((task_dir / 'manifest.json').read_bytes())
                     stage = data.get('stage', '...')
-                    task_id = data.get('task_id', '')
-                    return (
-                        f'{BOLD}{task_id}{RST}  '
-                        f'{CYN}[{stage}]{RST}'
-                    )
+                return (
+                    f'{BOLD}{task_dir.name}{RST}  '
+                    f'{CYN}[{stage}]{RST}'
+                )
         except Exception:
             pass
         return f'{DIM}실행 중...{RST}'
 
+    def _latest_task_dir(self) -> Optional[Path]:
+        """가장 최근 task 디렉토리.
+
+        렌더링마다 호출되므로, tasks/ 디렉토리의 mtime이 바뀐 경우
+        (task 추가/삭제)에만 다시 스캔한다.
+        """
+        orc = self.orchestrator
+        if not orc:
+            return None
+        # tasks/ 경로 문자열은 Orchestrator가 바뀔 때만 다시 만든다
+        if self._tasks_dir is None or self._tasks_dir[0] is not orc:
+            self._tasks_dir = (orc, os.path.join(orc.workspace_root, 'tasks'))
+        tasks_dir = self._tasks_dir[1]
+        try:
+            cursor = (tasks_dir, os.stat(tasks_dir).st_mtime_ns)
+        except OSError:
+            return None
+        if cursor != self._task_cursor:
+            with os.scandir(tasks_dir) as it:
+                names = [
+                    e.name for e in it
+                    if e.name.startswith('task-') and e.is_dir()
+                ]
+            self._latest_task = Path(tasks_dir, max(names)) if names else None
+            self._task_cursor = cursor
+        return self._latest_task
+
     def _get_timeline_tail(self, n: int) -> List[str]:
         """timeline.log 마지막 n줄."""
         orc = self.orchestrator
         if not orc:
             return []
         try:
-            ws = orc.workspace_root
-            task_dirs = sorted(
-                (ws / 'tasks').glob('task-*'), reverse=True
-            )
-            if task_dirs:
-                log = task_dirs[0] / 'timeline.log'
-                if log.exists():
-                    lines = log.read_text().splitlines()
-                    return lines[-n:] if lines else []
+            task_dir = self._latest_task_dir()
+            if task_dir:
+                lines = (task_dir / 'timeline.log').read_text().splitlines()
+                return lines[-n:] if lines else []
         except Exception:
             pass
         return []
@@ -620,32 +889,56 @@ class InteractiveCLI:
 
 # ─── 레거시 arg 모드 (하위 호환) ─────────────────────────────────────────────
 
+def _run_status():
+    """작업 이력 화면으로 바로 진입."""
+    cli = InteractiveCLI()
+    cli._enter_status()
+    cli.run()
+
+
+def _build_run_parser(sub):
+    rp = sub.add_parser('run', help='파이프라인 실행')
+    rp.add_argument('-s', '--spec', type=Path, required=True)
+    rp.add_argument('-c', '--config', type=Path, default=Path('config.yaml'))
+    rp.add_argument('-v', '--verbose', action='store_true')
+    rp.add_argument('--no-tui', action='store_true', help='인터랙티브 없이 실행')
+
+
+def _build_status_parser(sub):
+    sub.add_parser('status', help='작업 상태 보기')
+
+
+_LEGACY_EPILOG = """
+Examples:
+  python cli.py run -s planning-spec.md
+  python cli.py run -s planning-spec.md --no-tui
+  python cli.py status
+        """
+
+_LEGACY_COMMANDS = {
+    'run':    _build_run_parser,
+    'status': _build_status_parser,
+}
+
+
 def _run_legacy():
     """기존 argparse 기반 CLI 동작 (args 있을 때)."""
     import argparse
-    from orchestrator.main import Orchestrator
 
     parser = argparse.ArgumentParser(
         description='Multi-Agent Development System',
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python cli.py run -s planning-spec.md
-  python cli.py run -s planning-spec.md --no-tui
-  python cli.py status
-        """,
+        epilog=_LEGACY_EPILOG,
     )
     sub = parser.add_subparsers(dest='cmd')
 
-    # run
-    rp = sub.add_parser('run', help='파이프라인 실행')
-    rp.add_argument('-s', '--spec', type=Path, required=True)
-    rp.add_argument('-c', '--config', type=Path, default=Path('config.yaml'))
-    rp.add_argument('-v', '--verbose', action='store_true')
-    rp.add_argument('--no-tui', action='store_true', help='인터랙티브 없이 실행')
-
-    # status
-    sub.add_parser('status', help='작업 상태 보기')
+    # 요청된 서브커맨드의 파서만 구성 (--help/알 수 없는 명령은 전체 구성)
+    cmd = next((a for a in sys.argv[1:] if not a.startswith('-')), None)
+    if cmd in _LEGACY_COMMANDS:
+        _LEGACY_COMMANDS[cmd](sub)
+    else:
+        for build in _LEGACY_COMMANDS.values():
+            build(sub)
 
     args = parser.parse_args()
 
@@ -654,6 +947,7 @@ Examples:
             logging.getLogger().setLevel(logging.INFO)
 
         if args.no_tui:
+            from orchestrator.main import Orchestrator
             orc = Orchestrator(config_path=args.config)
             result = orc.run_from_spec(args.spec)
             if result.get('success'):
@@ -671,9 +965,7 @@ Examples:
             cli.run()
 
     elif args.cmd == 'status':
-        cli = InteractiveCLI()
-        cli._enter_status()
-        cli.run()
+        _run_status()
     else:
         parser.print_help()
 
@@ -681,7 +973,10 @@ Examples:
 # ─── 진입점 ──────────────────────────────────────────────────────────────────
 
 def main():
-    if len(sys.argv) > 1:
+    if sys.argv[1:] == ['status']:
+        # 옵션 없는 status는 argparse 구성 없이 바로 처리
+        _run_status()
+    elif len(sys.argv) > 1:
         _run_legacy()
     else:
         # 인터랙티브 모드
@@ -1,6 +1,14 @@
 """Multi-agent development system orchestrator."""
 
-from .main import Orchestrator
-
 __version__ = '0.1.0'
 __all__ = ['Orchestrator']
+
+
+def __getattr__(name):
+    # Importing a submodule (orchestrator.utils, orchestrator.queue, ...)
+    # should not pull in the whole pipeline; load main only when asked for.
+    if name == 'Orchestrator':
+        from .main import Orchestrator
+        globals()['Orchestrator'] = Orchestrator
+        return Orchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
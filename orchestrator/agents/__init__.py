@@ -1,13 +1,22 @@
-"""Agent implementations for the orchestrator."""
+"""Agent implementations for the orchestrator.
 
-from .base import BaseAgent
-from .architect import ArchitectAgent
-from .implementer import ImplementerAgent
-from .reviewer import ReviewerAgent
-from .tester import TesterAgent
-from .comparator import ComparatorAgent
-from .integrator import IntegratorAgent
-from .simplifier import SimplifierAgent
+Agent classes are imported lazily on first attribute access (PEP 562),
+so importing the package does not load every agent module up front.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    'BaseAgent': '.base',
+    'ArchitectAgent': '.architect',
+    'ImplementerAgent': '.implementer',
+    'ReviewerAgent': '.reviewer',
+    'TesterAgent': '.tester',
+    'ComparatorAgent': '.comparator',
+    'IntegratorAgent': '.integrator',
+    'SimplifierAgent': '.simplifier',
+}
 
 __all__ = [
     'BaseAgent',
@@ -19,3 +28,17 @@ __all__ = [
     'IntegratorAgent',
     'SimplifierAgent',
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,13 +2,23 @@
 
 from pathlib import Path
 from typing import Dict, Any
+import json
 import logging
+import re
 
 from .base import BaseAgent
+from ..utils.fast_json import json_loads
 
 
 logger = logging.getLogger(__name__)
 
+# Claude 출력에서 JSON 블록을 찾는 패턴 (호출마다 재컴파일하지 않도록 모듈 수준에 둔다)
+_JSON_LIST_BLOCK_RE = re.compile(r'```json\s*(\[.*?\])\s*```', re.DOTALL)
+_JSON_OBJECT_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_API_CONTRACT_BLOCK_RE = re.compile(
+    r'```json:api-contract\.json\s*(\{.*?\})\s*```', re.DOTALL
+)
+
 
 class ArchitectAgent(BaseAgent):
     """
@@ -16,6 +26,8 @@ class ArchitectAgent(BaseAgent):
     타겟 프로젝트의 기존 코드를 분석하여 프로젝트 맥락에 맞는 계획을 수립한다.
     """
 
+    __slots__ = ('prompt_file',)
+
     def __init__(self, workspace: Path, executor, prompt_file: Path):
         """
         Args:
@@ -109,14 +121,11 @@ class ArchitectAgent(BaseAgent):
 
     def _parse_approaches(self, output: str) -> list:
         """Claude 출력에서 approaches JSON을 파싱한다."""
-        import json
-        import re
-
         # ```json [...] ``` 블록 탐색
-        json_match = re.search(r'```json\s*(\[.*?\])\s*```', output, re.DOTALL)
+        json_match = _JSON_LIST_BLOCK_RE.search(output)
         if json_match:
             try:
-                approaches = json.loads(json_match.group(1))
+                approaches = json_loads(json_match.group(1))
                 if isinstance(approaches, list):
                     return approaches
             except json.JSONDecodeError:
@@ -124,7 +133,7 @@ class ArchitectAgent(BaseAgent):
 
         # 전체를 JSON으로 파싱 시도
         try:
-            data = json.loads(output)
+            data = json_loads(output)
             if isinstance(data, list):
                 return data
             elif isinstance(data, dict) and 'approaches' in data:
@@ -137,24 +146,18 @@ class ArchitectAgent(BaseAgent):
 
     def _parse_api_contract(self, output: str) -> dict:
         """Claude 출력에서 api-contract.json을 파싱한다 (통합 모드 전용)."""
-        import json
-        import re
-
         # ```json:api-contract.json { ... } ``` 블록 탐색
-        contract_match = re.search(
-            r'```json:api-contract\.json\s*(\{.*?\})\s*```',
-            output, re.DOTALL
-        )
+        contract_match = _API_CONTRACT_BLOCK_RE.search(output)
         if contract_match:
             try:
-                return json.loads(contract_match.group(1))
+                return json_loads(contract_match.group(1))
             except json.JSONDecodeError:
                 pass
 
         # ```json 블록 중 "endpoints" 키가 있는 것 탐색 (fallback)
-        for m in re.finditer(r'```json\s*(\{.*?\})\s*```', output, re.DOTALL):
+        for m in _JSON_OBJECT_BLOCK_RE.finditer(output):
             try:
-                data = json.loads(m.group(1))
+                data = json_loads(m.group(1))
                 if isinstance(data, dict) and 'endpoints' in data:
                     return data
             except json.JSONDecodeError:
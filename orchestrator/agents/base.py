@@ -1,18 +1,31 @@
 """Base agent class for all orchestrator agents."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
+import hashlib
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 import json
+import re
 from datetime import datetime
 
 from ..executor import ClaudeExecutor
 from ..utils.atomic_write import atomic_write
+from ..utils.fast_json import json_loads
 
 
 logger = logging.getLogger(__name__)
 
+# {name} placeholders in prompt templates
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+
+@lru_cache(maxsize=64)
+def _read_template(path_str: str, mtime_ns: int) -> str:
+    """Read a prompt template file (cached; mtime_ns keys out stale entries)."""
+    return Path(path_str).read_text()
+
 
 class BaseAgent(ABC):
     """
@@ -20,6 +33,9 @@ class BaseAgent(ABC):
     Provides common functionality for execution and state management.
     """
 
+    __slots__ = ('name', 'workspace', 'executor', 'prompt_template', 'state',
+                 'state_file', '_state_dirty', 'response_cache_dir')
+
     def __init__(
         self,
         name: str,
@@ -40,15 +56,20 @@ class BaseAgent(ABC):
         self.workspace = Path(workspace)
         self.executor = executor
         self.prompt_template = prompt_template
+        now = datetime.now().isoformat()
         self.state = {
             'status': 'initialized',
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
+            'created_at': now,
+            'updated_at': now
         }
 
         # Create agent workspace
         self.workspace.mkdir(parents=True, exist_ok=True)
         self.state_file = self.workspace / f'{name}_state.json'
+        # True while self.state has changes not yet written to state_file
+        self._state_dirty = True
+        # Opt-in: directory for cached Claude responses (see execute_claude)
+        self.response_cache_dir: Optional[Path] = None
 
     @abstractmethod
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -67,24 +88,35 @@ class BaseAgent(ABC):
         """
         Update agent state.
 
+        Updates that change nothing are ignored, so the state file is only
+        rewritten when its content would actually differ.
+
         Args:
             updates: Dict of state updates
         """
-        self.state.update(updates)
-        self.state['updated_at'] = datetime.now().isoformat()
-        self._save_state()
+        state = self.state
+        if any(k not in state or state[k] != v for k, v in updates.items()):
+            state.update(updates)
+            state['updated_at'] = datetime.now().isoformat()
+            self._state_dirty = True
+
+        # Also retries a write that failed on an earlier call
+        if self._state_dirty:
+            self._save_state()
 
     def _save_state(self) -> None:
         """Save current state to file."""
         atomic_write(self.state_file, self.state)
+        self._state_dirty = False
 
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file."""
-        if self.state_file.exists():
-            try:
-                return json.loads(self.state_file.read_text())
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to load state for {self.name}")
+        try:
+            return json_loads(self.state_file.read_bytes())
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to load state for {self.name}")
         return {}
 
     def load_prompt(self, prompt_file: Path, **kwargs) -> str:
@@ -98,48 +130,78 @@ class BaseAgent(ABC):
         Returns:
             Formatted prompt string
         """
-        if not prompt_file.exists():
+        try:
+            mtime_ns = prompt_file.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
 
-        template = prompt_file.read_text()
+        # The same template is loaded once per approach; reuse the text
+        template = _read_template(str(prompt_file), mtime_ns)
 
-        # Simple string substitution
-        for key, value in kwargs.items():
-            placeholder = f"{{{key}}}"
-            template = template.replace(placeholder, str(value))
-
-        return template
+        # Single-pass substitution; unknown placeholders are left as-is
+        return _PLACEHOLDER_RE.sub(
+            lambda m: str(kwargs[m.group(1)]) if m.group(1) in kwargs
+            else m.group(0),
+            template,
+        )
 
     def execute_claude(
         self,
         prompt: str,
         working_dir: Optional[Path] = None,
-        output_file: Optional[Path] = None
+        output_file: Optional[Path] = None,
+        cache_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Execute Claude with the given prompt.
 
+        When cache_key is given and response_cache_dir is set, a successful
+        result is stored under a hash of (model, cache_key) and replayed on
+        the next call with the same key instead of invoking Claude again.
+        Only use this for agents whose sole side effect is output_file.
+
         Args:
             prompt: Prompt to execute
             working_dir: Optional working directory (defaults to agent workspace)
             output_file: Optional output file path
+            cache_key: Stable identity of every input the response depends
+                on (e.g. a worktree fingerprint plus the prompt with run-specific
+                paths normalised). The raw prompt is not part of the key.
 
         Returns:
-            Execution result dict
+            Execution result dict ('cached': True when replayed)
         """
         if working_dir is None:
             working_dir = self.workspace
 
+        model = self.executor.model_for(self.name)
+
+        cache_file = None
+        if cache_key is not None and self.response_cache_dir is not None:
+            digest = hashlib.sha256(
+                f'{model}\0{cache_key}'.encode('utf-8')
+            ).hexdigest()
+            cache_file = self.response_cache_dir / f'{digest}.json'
+            cached = self._replay_cached_response(cache_file, output_file)
+            if cached is not None:
+                return cached
+
         self.update_state({'status': 'running'})
 
         result = self.executor.execute(
             prompt=prompt,
             working_dir=working_dir,
-            output_file=output_file
+            output_file=output_file,
+            model=model
         )
 
         if result['success']:
             self.update_state({'status': 'completed'})
+            if cache_file is not None:
+                try:
+                    atomic_write(cache_file, result)
+                except (OSError, TypeError, ValueError) as e:
+                    logger.debug(f"Failed to cache response for {self.name}: {e}")
         else:
             self.update_state({
                 'status': 'failed',
@@ -148,19 +210,39 @@ class BaseAgent(ABC):
 
         return result
 
-    def write_output(self, filename: str, content: Any) -> Path:
+    def _replay_cached_response(
+        self, cache_file: Path, output_file: Optional[Path]
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached execute_claude result, or None on a miss."""
+        try:
+            result = json_loads(cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring corrupt response cache: {cache_file}")
+            return None
+
+        if output_file:
+            atomic_write(output_file, result.get('output', ''))
+        result['cached'] = True
+        self.update_state({'status': 'completed'})
+        logger.info(f"{self.name}: reusing cached response ({cache_file.name})")
+        return result
+
+    def write_output(self, filename: str, content: Any, durable: bool = False) -> Path:
         """
         Write output to a file in the workspace.
 
         Args:
             filename: Output filename
             content: Content to write (str or dict)
+            durable: fsync before returning (see atomic_write)
 
         Returns:
             Path to written file
         """
         output_path = self.workspace / filename
-        atomic_write(output_path, content)
+        atomic_write(output_path, content, durable=durable)
         logger.info(f"Wrote output: {output_path}")
         return output_path
 
@@ -176,15 +258,15 @@ class BaseAgent(ABC):
         """
         input_path = self.workspace / filename
 
-        if not input_path.exists():
+        try:
+            content = input_path.read_text()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
-        content = input_path.read_text()
-
         # Try to parse as JSON
         if filename.endswith('.json'):
             try:
-                return json.loads(content)
+                return json_loads(content)
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse {filename} as JSON")
 
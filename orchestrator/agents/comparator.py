@@ -1,14 +1,26 @@
 """Comparator agent for comparing all implementations."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List
+import json
 import logging
+import re
 
 from .base import BaseAgent
+from ..utils.fast_json import json_loads
 
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; matches a fenced ```json [...] ``` block
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\[.*?\])\s*```', re.DOTALL)
+
+# Only the head of each review goes into the prompt
+_REVIEW_PROMPT_CHARS = 1500
+# Worst case 4 bytes per UTF-8 char, plus one char so truncation is still detected
+_REVIEW_READ_BYTES = (_REVIEW_PROMPT_CHARS + 1) * 4
+
 
 class ComparatorAgent(BaseAgent):
     """
@@ -16,6 +28,8 @@ class ComparatorAgent(BaseAgent):
     Output: comparison.md and rankings.json
     """
 
+    __slots__ = ('prompt_file',)
+
     def __init__(self, workspace: Path, executor, prompt_file: Path):
         """
         Initialize the Comparator agent.
@@ -102,77 +116,85 @@ class ComparatorAgent(BaseAgent):
           1. review_workspace / test_workspace (task_dir/review-N/, test-N/)
           2. worktree 내부 fallback (impl['path']/review.md 등)
         """
-        import json
-
-        data = []
-
-        for impl in implementations:
-            impl_data = {
-                'approach_id': impl.get('approach_id'),
-                'path': impl.get('path'),
-                'approach': impl.get('approach', {}),
-            }
-
-            # 리뷰 결과 탐색
-            review_workspace = impl.get('review_workspace', '')
-            review_content = self._find_review(review_workspace, impl.get('path', ''))
-            if review_content:
-                impl_data['review'] = review_content
-
-            # 테스트 결과 탐색
-            test_workspace = impl.get('test_workspace', '')
-            test_results = self._find_test_results(test_workspace, impl.get('path', ''))
-            if test_results is not None:
-                impl_data['test_results'] = test_results
-
-            data.append(impl_data)
-
-        return data
+        if len(implementations) <= 1:
+            return [self._gather_one(impl) for impl in implementations]
+
+        # 구현별 파일 읽기는 서로 독립적인 I/O이므로 병렬로 수행 (순서 유지)
+        with ThreadPoolExecutor(max_workers=min(8, len(implementations))) as pool:
+            return list(pool.map(self._gather_one, implementations))
+
+    def _gather_one(self, impl: Dict) -> Dict:
+        """구현 하나의 비교 데이터(리뷰/테스트 결과)를 모은다."""
+        impl_data = {
+            'approach_id': impl.get('approach_id'),
+            'path': impl.get('path'),
+            'approach': impl.get('approach', {}),
+        }
+
+        # 리뷰 결과 탐색
+        review_workspace = impl.get('review_workspace', '')
+        review_content = self._find_review(review_workspace, impl.get('path', ''))
+        if review_content:
+            impl_data['review'] = review_content
+
+        # 테스트 결과 탐색
+        test_workspace = impl.get('test_workspace', '')
+        test_results = self._find_test_results(test_workspace, impl.get('path', ''))
+        if test_results is not None:
+            impl_data['test_results'] = test_results
+
+        return impl_data
 
     def _find_review(self, review_workspace: str, impl_path: str) -> str:
         """리뷰 결과를 탐색한다."""
-        # 1순위: review_workspace 내 review.md
-        if review_workspace:
-            ws = Path(review_workspace)
-            for name in ('review.md', 'code-review.md'):
-                candidate = ws / name
-                if candidate.exists():
-                    return candidate.read_text()
-
-        # 2순위: worktree 내부 fallback
-        if impl_path:
-            fallback = Path(impl_path) / 'review.md'
-            if fallback.exists():
-                return fallback.read_text()
+        for candidate in self._candidates(
+            review_workspace, ('review.md', 'code-review.md'),
+            impl_path, 'review.md',
+        ):
+            try:
+                return self._read_review_head(candidate)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
 
         return ''
 
+    @staticmethod
+    def _read_review_head(path: Path) -> str:
+        """프롬프트에 들어갈 만큼만 리뷰 앞부분을 읽는다."""
+        with open(path, 'rb') as f:
+            head = f.read(_REVIEW_READ_BYTES)
+        # 잘린 마지막 멀티바이트 문자는 어차피 잘라낼 구간에 속한다
+        return head.decode('utf-8', errors='replace')
+
     def _find_test_results(self, test_workspace: str, impl_path: str):
         """테스트 결과를 탐색한다."""
-        import json
-
-        # 1순위: test_workspace 내 test_results.json
-        if test_workspace:
-            ws = Path(test_workspace)
-            for name in ('test_results.json', 'test-results.json'):
-                candidate = ws / name
-                if candidate.exists():
-                    try:
-                        return json.loads(candidate.read_text())
-                    except json.JSONDecodeError:
-                        pass
-
-        # 2순위: worktree 내부 fallback
-        if impl_path:
-            fallback = Path(impl_path) / 'test_results.json'
-            if fallback.exists():
-                try:
-                    return json.loads(fallback.read_text())
-                except json.JSONDecodeError:
-                    pass
+        for candidate in self._candidates(
+            test_workspace, ('test_results.json', 'test-results.json'),
+            impl_path, 'test_results.json',
+        ):
+            try:
+                return json_loads(candidate.read_bytes())
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            except json.JSONDecodeError:
+                pass
 
         return None
 
+    @staticmethod
+    def _candidates(workspace: str, names, impl_path: str, fallback_name: str):
+        """탐색 우선순위대로 후보 경로를 만든다.
+
+        1순위: workspace 내 names, 2순위: worktree(impl_path) 내부 fallback.
+        존재 확인 없이 바로 열어 보고 없으면 다음 후보로 넘어간다.
+        """
+        if workspace:
+            ws = Path(workspace)
+            for name in names:
+                yield ws / name
+        if impl_path:
+            yield Path(impl_path) / fallback_name
+
     def _format_comparison_data(self, data: List[Dict]) -> str:
         """Format comparison data for the prompt."""
         lines = []
@@ -190,8 +212,8 @@ class ComparatorAgent(BaseAgent):
             if 'review' in impl:
                 review_text = impl['review']
                 # 1,500자까지 포함 (pre-computed metrics가 주요 데이터 소스)
-                if len(review_text) > 1500:
-                    review_text = review_text[:1500] + '\n\n... (전체 리뷰는 review.md 참조)'
+                if len(review_text) > _REVIEW_PROMPT_CHARS:
+                    review_text = review_text[:_REVIEW_PROMPT_CHARS] + '\n\n... (전체 리뷰는 review.md 참조)'
                 lines.append(f"\n### Code Review\n{review_text}")
 
             if 'test_results' in impl:
@@ -212,15 +234,12 @@ class ComparatorAgent(BaseAgent):
         Returns:
             List of approach IDs in ranked order (best first)
         """
-        import json
-        import re
-
         # Try to find JSON rankings
-        json_match = re.search(r'```json\s*(\[.*?\])\s*```', output, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(output)
 
         if json_match:
             try:
-                rankings = json.loads(json_match.group(1))
+                rankings = json_loads(json_match.group(1))
                 if isinstance(rankings, list) and len(rankings) == num_implementations:
                     return rankings
             except json.JSONDecodeError:
@@ -10,12 +10,29 @@ from .base import BaseAgent
 logger = logging.getLogger(__name__)
 
 
+def _bullet_section(header: str):
+    """header 줄 아래에 항목을 '  - ' 목록으로 붙이는 포매터를 만든다."""
+    return lambda items: '\n'.join([header, *(f"  - {item}" for item in items)])
+
+
+# 접근법 필드 → 포매터 (프롬프트에 나오는 순서대로)
+_APPROACH_FIELDS = (
+    ('name', '접근법: {}'.format),
+    ('description', '\n설명:\n{}'.format),
+    ('key_decisions', _bullet_section('\n주요 결정:')),
+    ('libraries', lambda libraries: f"\n라이브러리: {', '.join(libraries)}"),
+    ('trade_offs', _bullet_section('\n트레이드오프:')),
+)
+
+
 class ImplementerAgent(BaseAgent):
     """
     할당된 접근법에 따라 타겟 프로젝트의 git worktree에서 코드를 작성한다.
     워크스페이스가 곧 타겟 프로젝트의 전체 파일이므로, 기존 코드 위에서 작업한다.
     """
 
+    __slots__ = ('approach_id', 'prompt_file')
+
     def __init__(
         self,
         approach_id: int,
@@ -112,9 +129,8 @@ class ImplementerAgent(BaseAgent):
                 'status': 'completed',
                 'duration': result.get('duration', 0)
             }
-            # .multi-agent/ 디렉토리에 메타 파일 저장
-            meta_dir = self.workspace / '.multi-agent'
-            meta_dir.mkdir(parents=True, exist_ok=True)
+            # .multi-agent/ 디렉토리에 메타 파일 저장 (로그 저장 시 이미 생성됨)
+            meta_dir = output_file.parent
 
             from ..utils.atomic_write import atomic_write
             atomic_write(meta_dir / 'summary.json', summary)
@@ -125,28 +141,9 @@ class ImplementerAgent(BaseAgent):
 
     def _format_approach(self, approach: Dict[str, Any]) -> str:
         """접근법 딕셔너리를 읽기 쉬운 텍스트로 변환한다."""
-        lines = []
-
-        if 'name' in approach:
-            lines.append(f"접근법: {approach['name']}")
-
-        if 'description' in approach:
-            lines.append(f"\n설명:\n{approach['description']}")
-
-        if 'key_decisions' in approach:
-            lines.append("\n주요 결정:")
-            for decision in approach['key_decisions']:
-                lines.append(f"  - {decision}")
-
-        if 'libraries' in approach:
-            lines.append(f"\n라이브러리: {', '.join(approach['libraries'])}")
-
-        if 'trade_offs' in approach:
-            lines.append("\n트레이드오프:")
-            for trade_off in approach['trade_offs']:
-                lines.append(f"  - {trade_off}")
-
-        return '\n'.join(lines)
+        return '\n'.join(
+            fmt(approach[key]) for key, fmt in _APPROACH_FIELDS if key in approach
+        )
 
     def _build_retry_instruction(self, review_feedback: str) -> str:
         """리뷰 피드백을 기반으로 재구현 지시사항을 생성한다."""
@@ -9,6 +9,9 @@ from .base import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# 구현 목록 한 줄 형식 (모듈 로드 시 한 번 준비)
+_IMPL_LINE = "- {name} (concern: {concern}), branch: {branch}, status: {status}".format
+
 
 class IntegratorAgent(BaseAgent):
     """
@@ -18,6 +21,8 @@ class IntegratorAgent(BaseAgent):
     - 통합 빌드 검증
     """
 
+    __slots__ = ('prompt_file',)
+
     def __init__(self, workspace: Path, executor, prompt_file: Path):
         """
         Args:
@@ -83,16 +88,16 @@ class IntegratorAgent(BaseAgent):
         merge_results: List[Dict]
     ) -> str:
         """구현 목록을 프롬프트용 텍스트로 포매팅한다."""
+        mr_by_branch = {m['branch']: m for m in merge_results}
         lines = []
         for impl in impls:
-            branch = impl.get('branch', '')
             approach = impl.get('approach', {})
-            name = approach.get('name', 'N/A')
-            concern = approach.get('concern', 'N/A')
-            mr = next((m for m in merge_results if m['branch'] == branch), {})
-            status = 'Conflict' if mr.get('conflict') else 'Merged'
-            lines.append(
-                f"- {name} (concern: {concern}), "
-                f"branch: {branch}, status: {status}"
-            )
+            branch = impl.get('branch', '')
+            conflict = mr_by_branch.get(branch, {}).get('conflict')
+            lines.append(_IMPL_LINE(
+                name=approach.get('name', 'N/A'),
+                concern=approach.get('concern', 'N/A'),
+                branch=branch,
+                status='Conflict' if conflict else 'Merged',
+            ))
         return '\n'.join(lines)
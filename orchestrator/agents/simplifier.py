@@ -22,6 +22,8 @@ class SimplifierAgent(BaseAgent):
       for a cumulative development guideline document.
     """
 
+    __slots__ = ('approach_id', 'prompt_file')
+
     def __init__(
         self,
         approach_id: int,
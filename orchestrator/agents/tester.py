@@ -16,6 +16,8 @@ class TesterAgent(BaseAgent):
     Output: test files and test_results.json
     """
 
+    __slots__ = ('approach_id', 'prompt_file')
+
     def __init__(
         self,
         approach_id: int,
@@ -83,7 +85,7 @@ class TesterAgent(BaseAgent):
                 'test_log': str(output_file),
                 'status': 'completed'
             }
-            self.write_output('test_results.json', test_data)
+            self.write_output('test_results.json', test_data, durable=True)
 
         logger.info(f"Tester {self.approach_id} completed")
 
@@ -63,6 +63,7 @@ class ClaudeExecutor:
         retry_delay: int = 5,
         permission_handler: 'PermissionHandler' = None,
         notifier=None,
+        models: Optional[Dict[str, str]] = None,
     ):
         """
         Initialize the Claude executor.
@@ -75,10 +76,13 @@ class ClaudeExecutor:
             retry_delay: Delay between retries in seconds
             permission_handler: 권한 규칙 핸들러
             notifier: SystemNotifier 인스턴스 (권한 알림용)
+            models: 에이전트 종류별 모델 (예: {'implementer': 'sonnet'}).
+                지정되지 않은 에이전트는 Claude CLI 기본 모델을 사용한다.
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.notifier = notifier
+        self.models = dict(models or {})
 
         # permission_handler가 없으면 기본 규칙 적용
         if permission_handler is None:
@@ -88,6 +92,10 @@ class ClaudeExecutor:
             )
         self.permission_handler = permission_handler
 
+    def model_for(self, agent_name: str) -> Optional[str]:
+        """에이전트 이름('reviewer-2' 등)에 해당하는 모델을 반환한다 (없으면 None)."""
+        return self.models.get(agent_name.partition('-')[0])
+
     @staticmethod
     def _is_non_retryable(error_msg: str) -> bool:
         """재시도해도 해결되지 않는 에러인지 판별한다."""
@@ -99,7 +107,8 @@ class ClaudeExecutor:
         prompt: str,
         working_dir: Path,
         output_file: Optional[Path] = None,
-        env_vars: Optional[Dict[str, str]] = None
+        env_vars: Optional[Dict[str, str]] = None,
+        model: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Execute Claude Code with the given prompt.
@@ -109,6 +118,7 @@ class ClaudeExecutor:
             working_dir: Working directory for execution
             output_file: Optional file to save output
             env_vars: Optional environment variables
+            model: Optional model name/alias passed as --model
 
         Returns:
             Dict containing execution results:
@@ -129,7 +139,7 @@ class ClaudeExecutor:
 
             try:
                 start_time = time.time()
-                result = self._run_claude(prompt, working_dir, env_vars)
+                result = self._run_claude(prompt, working_dir, env_vars, model)
                 duration = time.time() - start_time
 
                 if result['success']:
@@ -211,7 +221,8 @@ class ClaudeExecutor:
         self,
         prompt: str,
         working_dir: Path,
-        env_vars: Optional[Dict[str, str]] = None
+        env_vars: Optional[Dict[str, str]] = None,
+        model: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Run Claude Code subprocess using stream-json protocol.
@@ -222,6 +233,7 @@ class ClaudeExecutor:
             prompt: The prompt to send
             working_dir: Working directory
             env_vars: Optional environment variables
+            model: Optional model name/alias (--model)
 
         Returns:
             Dict with success, output, error, session_id, cost_usd
@@ -236,6 +248,8 @@ class ClaudeExecutor:
             '--output-format', 'stream-json',
             '--verbose',
         ]
+        if model:
+            cmd += ['--model', model]
 
         # 환경 변수
         env = os.environ.copy()
@@ -505,7 +519,9 @@ Timestamp: {timestamp}
 
             # working_dir에서 task_dir 추출
             # 패턴: .../workspace/tasks/task-YYYYMMDD-HHMMSS/...
-            working_dir_str = str(working_dir.resolve())
+            # resolve()로 실제 경로 변환 (심볼릭 링크 해결, 한 번만 수행)
+            working_dir_resolved = working_dir.resolve()
+            working_dir_str = str(working_dir_resolved)
             match = re.search(r'(.*?/workspace/tasks/(task-\d{8}-\d{6}))', working_dir_str)
 
             if not match:
@@ -513,12 +529,11 @@ Timestamp: {timestamp}
                 logger.debug(f"Not a task directory, skipping full transcript: {working_dir}")
                 return
 
-            task_dir = Path(match.group(1)).resolve()
+            # 이미 resolve된 경로의 접두부이므로 다시 resolve할 필요 없음
+            task_dir = Path(match.group(1))
             task_id = match.group(2)
 
             # Phase 이름 추론 (working_dir에서)
-            # resolve()로 실제 경로 변환 (심볼릭 링크 해결)
-            working_dir_resolved = working_dir.resolve()
             relative_path = working_dir_resolved.relative_to(task_dir)
             phase_name = self._infer_phase_name(relative_path)
 
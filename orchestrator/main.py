@@ -32,6 +32,8 @@ from .utils import (
     validate_spec,
     write_validation_errors,
     ProjectAnalyzer,
+    load_config,
+    json_loads,
 )
 from .utils.context_builder import (
     build_architect_inline_context,
@@ -136,6 +138,7 @@ class Orchestrator:
             max_retries=self.config['execution']['max_retries'],
             permission_handler=permission_handler,
             notifier=self.notifier,
+            models=self.config['execution'].get('models'),
         )
 
         # Git 관리자 (projects 레지스트리에서 resolve)
@@ -176,6 +179,9 @@ class Orchestrator:
         self.max_review_retries = self.config.get('pipeline', {}).get(
             'max_review_retries', 1
         )
+        self.review_cache = self.config.get('pipeline', {}).get(
+            'review_cache', False
+        )
 
         # Agent Registry (skills + schemas integration)
         skills_dir = Path(self.config.get('skills', {}).get('directory', './skills'))
@@ -845,14 +851,22 @@ class Orchestrator:
             review_workspace = task_dir / f'review-{approach_id}'
             review_workspace.mkdir(parents=True, exist_ok=True)
 
+            # worktree 내용 해시: 같은 코드에 대한 재리뷰 생략 / 리뷰 캐시 키
+            fingerprint = self.git_manager.get_worktree_fingerprint(Path(impl_path))
+            review_cache_dir = None
+            if self.review_cache:
+                review_cache_dir = self.workspace_root / '.cache' / 'responses' / 'reviewer'
+
             reviewer = ReviewerAgent(
                 approach_id, review_workspace,
-                self.executor, reviewer_prompt
+                self.executor, reviewer_prompt,
+                response_cache_dir=review_cache_dir,
             )
             review_result = reviewer.run({
                 'impl_path': impl_path,
                 'approach': impl.get('approach', {}),
                 'impl_context': impl_context,
+                'worktree_fingerprint': fingerprint,
             })
             impl['review_success'] = review_result['success']
             impl['review_workspace'] = str(review_workspace)
@@ -1000,6 +1014,14 @@ class Orchestrator:
 
             impl['success'] = impl_result['success']
 
+            # 재구현이 코드를 바꾸지 않았으면 기존 리뷰를 그대로 둔다
+            # (Reviewer가 tree_hash 일치를 보고 재리뷰를 생략)
+            if review_ws and self._review_is_current(Path(review_ws), Path(worktree_path)):
+                self.logger.info(
+                    f"impl-{approach_id}: 재구현 후 변경 없음, 기존 리뷰 유지"
+                )
+                continue
+
             # 이전 리뷰 workspace 정리 (재리뷰를 위해)
             if review_ws and Path(review_ws).exists():
                 old_review = Path(review_ws)
@@ -1009,6 +1031,17 @@ class Orchestrator:
                     shutil.rmtree(backup_path)
                 old_review.rename(backup_path)
 
+    def _review_is_current(self, review_ws: Path, worktree_path: Path) -> bool:
+        """review_ws의 리뷰가 worktree의 현재 내용에 대해 작성된 것인지 확인한다."""
+        try:
+            summary = json_loads((review_ws / 'review_summary.json').read_bytes())
+        except (OSError, ValueError):
+            return False
+        tree_hash = summary.get('tree_hash') if isinstance(summary, dict) else None
+        return bool(tree_hash) and (
+            tree_hash == self.git_manager.get_worktree_fingerprint(worktree_path)
+        )
+
     # ── Phase 4: 통합 (concern 모드) ─────────────────────────
 
     def _run_phase4_integration(
@@ -1044,6 +1077,23 @@ class Orchestrator:
         merge_results = []
         for impl in successful_impls:
             branch = impl['branch']
+
+            # 충돌이 예상되면 실제 머지(충돌 마커 생성 후 abort)를 생략
+            conflicts = self.git_manager.find_merge_conflicts(
+                integration_path, branch
+            )
+            if conflicts:
+                merge_results.append({
+                    'branch': branch,
+                    'status': 'conflict',
+                    'conflict': True,
+                    'error': f"충돌 파일: {', '.join(conflicts)}"
+                })
+                self.logger.warning(
+                    f"머지 충돌: {branch} - {', '.join(conflicts)}"
+                )
+                continue
+
             try:
                 self.git_manager._run_git(
                     ['merge', branch, '--no-edit'],
@@ -1380,10 +1430,13 @@ class Orchestrator:
                 ""
             ])
 
-            # 각 구현 정보
+            # 각 구현 정보 (approach_id -> 순위, 중복 시 첫 순위 유지)
+            rank_by_id = {}
+            for i, aid in enumerate(rankings):
+                rank_by_id.setdefault(aid, i + 1)
             for impl in implementations:
                 aid = impl['approach_id']
-                rank = rankings.index(aid) + 1 if aid in rankings else '?'
+                rank = rank_by_id.get(aid, '?')
                 lines.extend([
                     f"#### impl-{aid} (순위: #{rank})",
                     f"- **접근법**: {impl['approach'].get('name', 'N/A')}",
@@ -1662,10 +1715,20 @@ class Orchestrator:
         manifest: Dict[str, Any],
         stage: str
     ) -> None:
-        """manifest.json을 업데이트한다."""
+        """manifest.json을 업데이트한다.
+
+        단계만 필요한 조회(CLI 진행 표시 등)를 위해 stage.txt도 함께 쓴다.
+        """
         manifest['stage'] = stage
         manifest['updated_at'] = datetime.now().isoformat()
         atomic_write(manifest_file, manifest)
+        try:
+            # CLI가 폴링하므로 반쯤 쓰인 내용이 보이지 않도록 원자적으로 쓴다
+            atomic_write(
+                manifest_file.parent / 'stage.txt', stage.encode('utf-8'), mode='wb'
+            )
+        except OSError:
+            pass
 
     def _log_timeline(
         self,
@@ -1775,16 +1838,8 @@ class Orchestrator:
         return token_ref
 
     def _load_config(self, config_path: Path) -> Dict[str, Any]:
-        """YAML 설정 파일을 로드한다."""
-        import yaml
-
-        if not config_path.exists():
-            raise FileNotFoundError(
-                f"설정 파일을 찾을 수 없습니다: {config_path}"
-            )
-
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        """YAML 설정 파일을 로드한다 (mtime 기반 JSON 캐시 사용)."""
+        return load_config(config_path)
 
     @staticmethod
     def create_default_config(output_path: Path) -> None:
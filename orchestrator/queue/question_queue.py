@@ -9,6 +9,7 @@ from datetime import datetime
 
 from .models import Question, Answer, QuestionStatus
 from ..utils.atomic_write import atomic_write
+from ..utils.fast_json import json_loads
 
 
 logger = logging.getLogger(__name__)
@@ -223,7 +224,7 @@ class QuestionQueue:
             return
 
         try:
-            data = json.loads(self._queue_file.read_text())
+            data = json_loads(self._queue_file.read_bytes())
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(f"큐 파일 로드 실패: {e}")
             return
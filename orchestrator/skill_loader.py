@@ -35,6 +35,9 @@ _FRONTMATTER_RE = re.compile(
     re.DOTALL,
 )
 
+# Use libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class SkillLoader:
     """Loads and caches skill definitions from a directory of .md files."""
@@ -71,7 +74,7 @@ class SkillLoader:
             raise ValueError(f"No YAML frontmatter in {file_path}")
 
         try:
-            meta = yaml.safe_load(match.group(1))
+            meta = yaml.load(match.group(1), Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML frontmatter in {file_path}: {e}")
 
@@ -1,6 +1,8 @@
 """Utility modules for the orchestrator."""
 
 from .atomic_write import atomic_write
+from .config_loader import load_config
+from .fast_json import json_loads
 from .logger import setup_logger
 from .git_manager import GitManager, GitError
 from .notifier import SystemNotifier
@@ -19,6 +21,8 @@ from .context_builder import (
 
 __all__ = [
     'atomic_write',
+    'load_config',
+    'json_loads',
     'setup_logger',
     'GitManager',
     'GitError',
@@ -1,33 +1,102 @@
 """Atomic file write operations to prevent race conditions."""
 
+import math
 import os
 import json
 import tempfile
 from pathlib import Path
 from typing import Any, Union
 
+from .fast_json import orjson
 
-def atomic_write(file_path: Union[str, Path], content: Union[str, dict], mode: str = 'w') -> None:
+
+def _mkstemp_beside(file_path: Path):
+    """Create temp file in the same directory to ensure same filesystem."""
+    return tempfile.mkstemp(
+        dir=file_path.parent,
+        prefix=f'.{file_path.name}.',
+        suffix='.tmp'
+    )
+
+
+_JSON_SCALARS = (str, int, bool, type(None))
+
+
+def _orjson_compatible(obj: Any) -> bool:
+    """True if orjson would serialize obj to the same data json.dump does.
+
+    orjson writes NaN/Infinity as null and accepts types json.dump rejects
+    (date, datetime, UUID, dataclasses, subclasses of builtins), so only plain
+    JSON-native values with finite floats take the orjson path.
+    """
+    t = type(obj)
+    if t is dict:
+        return all(
+            (type(k) in _JSON_SCALARS or (type(k) is float and math.isfinite(k)))
+            and _orjson_compatible(v)
+            for k, v in obj.items()
+        )
+    if t is list or t is tuple:
+        return all(_orjson_compatible(v) for v in obj)
+    if t is float:
+        return math.isfinite(obj)
+    return t in _JSON_SCALARS
+
+
+def _fsync_dir(dir_path: Path) -> None:
+    """Persist a rename by fsyncing its directory (no-op where unsupported)."""
+    try:
+        dir_fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def atomic_write(
+    file_path: Union[str, Path],
+    content: Union[str, bytes, dict],
+    mode: str = 'w',
+    durable: bool = False
+) -> None:
     """
     Write content to a file atomically using temp file + rename pattern.
 
     Args:
         file_path: Target file path
-        content: Content to write (string or dict for JSON)
+        content: Content to write (string, bytes with mode='wb', or dict for JSON)
         mode: Write mode ('w' for text, 'wb' for binary)
+        durable: fsync the file before the rename and the directory after
+            it, so the new content survives a crash (slower; off by default)
 
     Raises:
         OSError: If write or rename fails
     """
     file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create temp file in the same directory to ensure same filesystem
-    fd, tmp_path = tempfile.mkstemp(
-        dir=file_path.parent,
-        prefix=f'.{file_path.name}.',
-        suffix='.tmp'
-    )
+    # orjson이 있으면 dict를 바이트로 직렬화 (json.dump와 같은 데이터,
+    # 작은 실수의 지수 표기 등 일부 서식만 다를 수 있음).
+    # NaN/Infinity나 JSON 기본 타입이 아닌 값, orjson이 처리하지 못하는 값
+    # (64비트 초과 정수 등)이 있으면 json.dump로 처리
+    if isinstance(content, dict) and orjson is not None and _orjson_compatible(content):
+        try:
+            content = orjson.dumps(
+                content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+            mode = 'wb'
+        except TypeError:
+            pass
+
+    # The parent usually exists already, so only create it on demand
+    try:
+        fd, tmp_path = _mkstemp_beside(file_path)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = _mkstemp_beside(file_path)
 
     try:
         with os.fdopen(fd, mode) as f:
@@ -35,6 +104,9 @@ def atomic_write(file_path: Union[str, Path], content: Union[str, dict], mode: s
                 json.dump(content, f, indent=2, ensure_ascii=False)
             else:
                 f.write(content)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
 
         # Atomic rename
         os.replace(tmp_path, file_path)
@@ -45,3 +117,6 @@ def atomic_write(file_path: Union[str, Path], content: Union[str, dict], mode: s
         except OSError:
             pass
         raise
+
+    if durable:
+        _fsync_dir(file_path.parent)
@@ -0,0 +1,104 @@
+"""config.yaml 로더.
+
+YAML 파싱 결과를 config.yaml 옆의 JSON 사이드카(config.yaml.cache.json)에
+캐시한다 (JSON으로 손실 없이 왕복되는 설정만). 사이드카에는 원본의
+mtime/크기가 함께 기록되어, 원본이 바뀌면 자동으로 무효화된다. JSON 파싱이 PyYAML 파싱보다 훨씬 빠르므로
+반복 실행 시 설정 로드 비용이 줄어든다.
+
+같은 프로세스 안에서는 (경로, mtime, 크기) 키의 LRU 캐시로
+사이드카 읽기까지 생략한다.
+"""
+
+import copy
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+from .atomic_write import atomic_write
+from .fast_json import json_loads
+
+
+logger = logging.getLogger(__name__)
+
+# 사이드카 형식 버전. 왕복 검사 없이 기록된 이전 사이드카는 무시한다
+_CACHE_VERSION = 2
+
+
+def _cache_path(config_path: Path) -> Path:
+    """config 파일에 대응하는 JSON 캐시 경로를 반환한다."""
+    return config_path.with_name(config_path.name + '.cache.json')
+
+
+def load_config(config_path: Path) -> Dict[str, Any]:
+    """YAML 설정 파일을 로드한다 (JSON 캐시 우선).
+
+    Args:
+        config_path: config.yaml 경로
+
+    Returns:
+        파싱된 설정 딕셔너리
+
+    Raises:
+        FileNotFoundError: 설정 파일이 없을 때
+    """
+    config_path = Path(config_path)
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"설정 파일을 찾을 수 없습니다: {config_path}"
+        )
+
+    # 호출자가 결과를 수정할 수 있으므로 (config_overrides 등) 사본을 반환
+    return copy.deepcopy(
+        _load_config_cached(str(config_path), st.st_mtime_ns, st.st_size)
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Dict[str, Any]:
+    """설정 파일 파싱 결과를 반환한다. mtime/크기가 바뀌면 캐시 키가 달라진다."""
+    config_path = Path(path_str)
+    cache_file = _cache_path(config_path)
+
+    # 캐시 적중: 기록된 mtime/크기가 원본과 같을 때만 사용
+    try:
+        cached = json_loads(cache_file.read_bytes())
+        if (
+            cached.get('version') == _CACHE_VERSION
+            and cached.get('mtime_ns') == mtime_ns
+            and cached.get('size') == size
+        ):
+            return cached['config']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    import yaml
+
+    # libyaml이 있으면 C 구현 로더 사용 (순수 Python 로더 대비 수 배 빠름)
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(config_path, encoding='utf-8') as f:
+        config = yaml.load(f, Loader=loader)
+
+    # 캐시 갱신 (실패해도 설정 로드는 계속).
+    # JSON으로 그대로 표현되지 않는 값(날짜, 문자열이 아닌 키 등)이 있으면
+    # 사이드카에서 읽을 때 타입이 바뀌므로 캐시하지 않는다
+    try:
+        serialized = json.dumps({
+            'version': _CACHE_VERSION,
+            'mtime_ns': mtime_ns,
+            'size': size,
+            'config': config,
+        }, indent=2, ensure_ascii=False)
+        if json_loads(serialized)['config'] == config:
+            atomic_write(cache_file, serialized)
+        else:
+            logger.debug("설정에 JSON으로 표현할 수 없는 값이 있어 캐시하지 않음")
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"설정 캐시 저장 실패: {e}")
+
+    return config
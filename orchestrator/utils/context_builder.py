@@ -10,10 +10,14 @@ AI API 호출 없이 동작한다 (비용 0원).
 """
 
 import json
+import mmap
+import os
 import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from .fast_json import json_loads
+
 
 # ────────────────────────────────────────────────────────
 # Transition A: Architect → Implementer
@@ -326,7 +330,7 @@ def build_test_metrics(test_workspace: Path) -> Dict[str, Any]:
     )
     if results_path:
         try:
-            data = json.loads(results_path.read_text())
+            data = json_loads(results_path.read_bytes())
             metrics['available'] = True
             metrics['status'] = data.get('status', 'unknown')
         except (json.JSONDecodeError, OSError):
@@ -334,12 +338,12 @@ def build_test_metrics(test_workspace: Path) -> Dict[str, Any]:
 
     # test_output.log 또는 test-results.md에서 추가 메트릭 추출
     for log_name in ['test_output.log', 'test-results.md']:
-        log_path = test_workspace / log_name
-        if log_path.exists():
-            content = log_path.read_text()
-            _extract_test_numbers(content, metrics)
-            metrics['available'] = True
-            break
+        try:
+            _scan_test_log(test_workspace / log_name, metrics)
+        except FileNotFoundError:
+            continue
+        metrics['available'] = True
+        break
 
     return metrics
 
@@ -584,25 +588,54 @@ def _find_file(directory: Path, candidates: List[str]) -> Optional[Path]:
     return None
 
 
-def _extract_test_numbers(content: str, metrics: Dict[str, Any]) -> None:
-    """테스트 출력에서 통과/실패 수, 커버리지를 추출한다."""
+# 테스트 로그 메트릭 패턴: (metrics 키, 변환 함수, 정규식)
+_TEST_METRIC_PATTERNS = (
     # 통과: "X passed", "X개 통과", "X tests passed"
-    passed_match = re.search(
-        r'(\d+)\s*(?:passed|tests?\s+passed|개\s*통과)', content, re.IGNORECASE
-    )
-    if passed_match:
-        metrics['tests_passed'] = int(passed_match.group(1))
-
+    ('tests_passed', int, r'(\d+)\s*(?:passed|tests?\s+passed|개\s*통과)'),
     # 실패: "X failed", "X개 실패"
-    failed_match = re.search(
-        r'(\d+)\s*(?:failed|tests?\s+failed|개\s*실패)', content, re.IGNORECASE
-    )
-    if failed_match:
-        metrics['tests_failed'] = int(failed_match.group(1))
-
+    ('tests_failed', int, r'(\d+)\s*(?:failed|tests?\s+failed|개\s*실패)'),
     # 커버리지: "XX%" (전체 커버리지 행에서)
-    coverage_match = re.search(
-        r'(?:coverage|커버리지)[:\s]*(\d+(?:\.\d+)?)\s*%', content, re.IGNORECASE
-    )
-    if coverage_match:
-        metrics['coverage_percent'] = float(coverage_match.group(1))
+    ('coverage_percent', float, r'(?:coverage|커버리지)[:\s]*(\d+(?:\.\d+)?)\s*%'),
+)
+
+# 디코딩한 로그용 (\s, \d가 유니코드 공백/숫자까지 매칭)
+_TEXT_METRIC_RES = tuple(
+    (key, cast, re.compile(pattern, re.IGNORECASE))
+    for key, cast, pattern in _TEST_METRIC_PATTERNS
+)
+# mmap용 UTF-8 바이트 패턴. 바이트 정규식의 \s, \d는 ASCII만 매칭하므로
+# 큰 로그에서는 유니코드 공백/숫자를 쓴 행을 인식하지 못한다
+_BYTES_METRIC_RES = tuple(
+    (key, cast, re.compile(pattern.encode('utf-8'), re.IGNORECASE))
+    for key, cast, pattern in _TEST_METRIC_PATTERNS
+)
+
+# 이보다 작은 로그는 mmap 설정 비용이 더 크므로 그냥 읽는다
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _scan_test_log(log_path: Path, metrics: Dict[str, Any]) -> None:
+    """테스트 로그에서 메트릭을 추출한다.
+
+    작은 로그는 디코딩해 문자열 패턴으로 검색하고, 큰 로그는 mmap으로
+    매핑해 메모리에 통째로 올리지 않고 바이트 패턴으로 검색한다.
+
+    Raises:
+        FileNotFoundError: 로그 파일이 없을 때
+    """
+    with open(log_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_MIN_SIZE:
+            content = f.read().decode('utf-8', errors='replace')
+            _extract_test_numbers(content, _TEXT_METRIC_RES, metrics)
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _extract_test_numbers(mm, _BYTES_METRIC_RES, metrics)
+
+
+def _extract_test_numbers(content, patterns, metrics: Dict[str, Any]) -> None:
+    """테스트 출력(str, bytes 또는 mmap)에서 통과/실패 수, 커버리지를 추출한다."""
+    for key, cast, pattern in patterns:
+        match = pattern.search(content)
+        if match:
+            metrics[key] = cast(match.group(1))
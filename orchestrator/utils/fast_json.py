@@ -0,0 +1,25 @@
+"""JSON 파싱 헬퍼.
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 동작한다.
+orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로
+호출자는 기존처럼 json.JSONDecodeError만 처리하면 된다.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """JSON 문자열/바이트를 파싱한다 (orjson 우선).
+
+    Raises:
+        json.JSONDecodeError: JSON 형식이 잘못되었을 때
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,7 +4,11 @@
 env_manager.py (symlink 기반)를 대체한다.
 """
 
+import os
+import re
+import shutil
 import subprocess
+import tempfile
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -264,6 +268,48 @@ class GitManager:
 
         return worktree_path, branch_name
 
+    def find_merge_conflicts(
+        self, worktree_path: Path, branch: str
+    ) -> Optional[List[str]]:
+        """branch를 worktree의 HEAD에 머지했을 때 충돌할 파일 목록을 반환한다.
+
+        `git merge-tree --write-tree`(git 2.38+)로 object DB 안에서만 머지를
+        계산하므로 작업 트리와 index는 바뀌지 않는다.
+
+        Args:
+            worktree_path: 머지 대상 worktree 경로
+            branch: 머지할 브랜치
+
+        Returns:
+            충돌 파일 목록 (깨끗하게 머지되면 빈 리스트).
+            git이 지원하지 않거나 판단할 수 없으면 None
+        """
+        cmd = [
+            'git', 'merge-tree', '--write-tree', '--name-only',
+            '--no-messages', 'HEAD', branch,
+        ]
+        logger.debug(f"git 실행: {' '.join(cmd)}")
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=worktree_path,
+                capture_output=True,
+                text=True,
+                timeout=120
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+
+        # exit 0: 충돌 없음, exit 1 + tree OID 출력: 충돌 (그 외는 판단 불가)
+        lines = result.stdout.splitlines()
+        if result.returncode not in (0, 1) or not lines or not re.fullmatch(
+            r'[0-9a-f]{40,64}', lines[0]
+        ):
+            return None
+        if result.returncode == 0:
+            return []
+        return [line for line in lines[1:] if line]
+
     def get_change_summary(self, worktree_path: Path) -> Dict:
         """worktree의 변경 사항 요약을 반환한다.
 
@@ -309,7 +355,6 @@ class GitManager:
             insertions = 0
             deletions = 0
 
-            import re
             ins_match = re.search(r'(\d+)\s+insertion', stat_line)
             del_match = re.search(r'(\d+)\s+deletion', stat_line)
             if ins_match:
@@ -334,6 +379,51 @@ class GitManager:
                 'stat': ''
             }
 
+    def get_worktree_fingerprint(self, worktree_path: Path) -> Optional[str]:
+        """worktree의 현재 내용을 식별하는 tree SHA를 반환한다.
+
+        커밋되지 않은 변경과 untracked 파일까지 포함한다 (.gitignore 대상 제외).
+        구현마다 새로 쓰이는 `.multi-agent/` 로그/요약은 코드가 아니므로 제외한다.
+        worktree의 index를 임시 파일로 복사해 그 위에서 `add -A` + `write-tree`를
+        수행하므로 실제 index와 작업 트리는 건드리지 않으며, 복사한 index의
+        stat 정보 덕분에 바뀌지 않은 파일은 다시 해시하지 않는다.
+
+        Args:
+            worktree_path: worktree 경로
+
+        Returns:
+            tree SHA (내용이 같으면 항상 같은 값). git 실패 시 None
+        """
+        try:
+            index_path = Path(worktree_path) / self._run_git(
+                ['rev-parse', '--git-path', 'index'],
+                cwd=worktree_path,
+                capture=True
+            ).strip()
+
+            with tempfile.TemporaryDirectory() as tmp:
+                tmp_index = os.path.join(tmp, 'index')
+                try:
+                    shutil.copyfile(index_path, tmp_index)
+                except OSError:
+                    pass  # index가 없으면 빈 index에서 시작
+                env = {**os.environ, 'GIT_INDEX_FILE': tmp_index}
+                self._run_git(
+                    ['rm', '-r', '-q', '--cached', '--ignore-unmatch',
+                     '--', '.multi-agent'],
+                    cwd=worktree_path, env=env
+                )
+                self._run_git(
+                    ['add', '-A', '--', '.', ':(exclude).multi-agent'],
+                    cwd=worktree_path, env=env
+                )
+                return self._run_git(
+                    ['write-tree'], cwd=worktree_path, capture=True, env=env
+                ).strip()
+        except GitError as e:
+            logger.debug(f"worktree fingerprint 계산 실패: {e}")
+            return None
+
     def list_worktrees(self) -> List[Dict]:
         """현재 활성 worktree 목록을 반환한다."""
         try:
@@ -365,7 +455,8 @@ class GitManager:
         self,
         args: List[str],
         cwd: Optional[Path] = None,
-        capture: bool = False
+        capture: bool = False,
+        env: Optional[Dict[str, str]] = None
     ) -> str:
         """git 명령을 실행한다.
 
@@ -373,6 +464,7 @@ class GitManager:
             args: git 명령 인자 리스트
             cwd: 작업 디렉토리
             capture: True이면 stdout 반환
+            env: 환경 변수 (None이면 현재 프로세스 환경 상속)
 
         Returns:
             capture=True일 때 stdout 텍스트
@@ -387,6 +479,7 @@ class GitManager:
             result = subprocess.run(
                 cmd,
                 cwd=cwd,
+                env=env,
                 capture_output=True,
                 text=True,
                 timeout=120
@@ -15,6 +15,8 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from .fast_json import json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -899,10 +901,8 @@ class ProjectAnalyzer:
 
     def _load_profile(self) -> Optional[Dict[str, Any]]:
         """기존 프로필을 로드한다."""
-        if not self.profile_path.exists():
-            return None
         try:
-            return json.loads(self.profile_path.read_text())
+            return json_loads(self.profile_path.read_bytes())
         except (json.JSONDecodeError, OSError):
             return None
 
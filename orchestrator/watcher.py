@@ -1,13 +1,86 @@
-"""File wait helpers for monitoring file events."""
+"""File wait helpers for monitoring file events.
 
+watchdog(inotify/FSEvents)가 설치되어 있으면 이벤트 기반으로 대기하고,
+없으면 기존 폴링 방식으로 동작한다.
+"""
+
+import os
+import threading
 import time
 import logging
 from pathlib import Path
 from typing import Optional
 
+from .utils.fast_json import json_loads
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+# 이벤트 기반 대기 중에도 이 간격마다 파일을 직접 재확인한다
+# (네트워크 파일시스템 등 이벤트가 누락될 수 있는 환경 대비)
+_EVENT_RECHECK_INTERVAL = 5.0
+
+# 대기를 깨우는 이벤트 종류. opened/closed_no_write 같은 읽기 이벤트는
+# 대기 루프 자신의 open()으로도 발생하므로 제외한다 (제외하지 않으면 busy loop)
+_WAKE_EVENT_TYPES = frozenset({'created', 'modified', 'moved', 'closed'})
+
+
+if WATCHDOG_AVAILABLE:
+    class _FileEventHandler(FileSystemEventHandler):
+        """특정 파일 이름에 대한 생성/수정/이동/쓰기 완료 이벤트를 감지한다."""
+
+        def __init__(self, file_name: str, changed: threading.Event):
+            super().__init__()
+            self._file_name = file_name
+            self._changed = changed
+
+        def on_any_event(self, event):
+            if event.event_type not in _WAKE_EVENT_TYPES:
+                return
+            for path in (event.src_path, getattr(event, 'dest_path', '')):
+                if path and os.path.basename(path) == self._file_name:
+                    self._changed.set()
+                    return
+
+
+def _start_observer(file_path: Path, changed: threading.Event):
+    """file_path의 상위 디렉토리를 감시하는 Observer를 시작한다.
+
+    Returns:
+        시작된 Observer. watchdog이 없거나 감시를 시작할 수 없으면 None
+        (호출자는 폴링으로 대체).
+    """
+    if not WATCHDOG_AVAILABLE:
+        return None
+
+    try:
+        observer = Observer()
+        observer.schedule(
+            _FileEventHandler(file_path.name, changed),
+            str(file_path.parent),
+            recursive=False,
+        )
+        observer.start()
+        return observer
+    except Exception as e:
+        logger.debug(f"파일 감시 시작 실패, 폴링으로 대체: {e}")
+        return None
+
+
+def _stop_observer(observer) -> None:
+    """Observer를 정지한다."""
+    if observer is None:
+        return
+    observer.stop()
+    observer.join(timeout=1.0)
+
 
 class FileWaitHelper:
     """Helper class for waiting on specific file events."""
@@ -21,22 +94,38 @@ class FileWaitHelper:
         """
         Wait for a file to be created.
 
+        watchdog이 있으면 생성 이벤트가 올 때까지 블로킹하고,
+        없으면 poll_interval 간격으로 폴링한다.
+
         Args:
             file_path: Path to wait for
             timeout: Maximum wait time in seconds
-            poll_interval: Check interval in seconds
+            poll_interval: Check interval in seconds (polling fallback only)
 
         Returns:
             True if file was created, False if timeout
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if file_path.exists():
-                return True
-            time.sleep(poll_interval)
-
-        return False
+        deadline = time.monotonic() + timeout
+        changed = threading.Event()
+        observer = _start_observer(file_path, changed)
+        path_str = os.fspath(file_path)
+
+        try:
+            while True:
+                if os.path.exists(path_str):
+                    return True
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+                if observer is not None:
+                    changed.wait(min(remaining, _EVENT_RECHECK_INTERVAL))
+                    changed.clear()
+                else:
+                    time.sleep(min(remaining, poll_interval))
+        finally:
+            _stop_observer(observer)
 
     @staticmethod
     def wait_for_file_content(
@@ -48,28 +137,43 @@ class FileWaitHelper:
         """
         Wait for a JSON file with specific key to be created/updated.
 
+        watchdog이 있으면 파일 이벤트가 올 때까지 블로킹하고,
+        없으면 poll_interval 간격으로 폴링한다.
+
         Args:
             file_path: Path to JSON file
             expected_key: Key that must exist in the JSON
             timeout: Maximum wait time
-            poll_interval: Check interval
+            poll_interval: Check interval (polling fallback only)
 
         Returns:
             Parsed JSON content if found, None if timeout
         """
         import json
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        changed = threading.Event()
+        observer = _start_observer(file_path, changed)
+        path_str = os.fspath(file_path)
 
-        while time.time() - start_time < timeout:
-            if file_path.exists():
+        try:
+            while True:
                 try:
-                    content = json.loads(file_path.read_text())
+                    with open(path_str, 'rb') as f:
+                        content = json_loads(f.read())
                     if expected_key in content:
                         return content
                 except (json.JSONDecodeError, OSError):
                     pass
 
-            time.sleep(poll_interval)
-
-        return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+
+                if observer is not None:
+                    changed.wait(min(remaining, _EVENT_RECHECK_INTERVAL))
+                    changed.clear()
+                else:
+                    time.sleep(min(remaining, poll_interval))
+        finally:
+            _stop_observer(observer)
@@ -0,0 +1,39 @@
+"""context_builder 테스트 메트릭 추출 테스트."""
+
+from orchestrator.utils.context_builder import _MMAP_MIN_SIZE, build_test_metrics
+
+
+def test_build_test_metrics_matches_unicode_whitespace_and_digits(tmp_path):
+    """작은 로그는 디코딩 후 검색하므로 유니코드 공백/숫자도 인식한다"""
+    # Given
+    (tmp_path / 'test_output.log').write_text(
+        '１２ passed, 3　failed\n커버리지: 87%\n',
+        encoding='utf-8',
+    )
+
+    # When
+    metrics = build_test_metrics(tmp_path)
+
+    # Then
+    assert metrics['available'] is True
+    assert metrics['tests_passed'] == 12
+    assert metrics['tests_failed'] == 3
+    assert metrics['coverage_percent'] == 87.0
+
+
+def test_build_test_metrics_scans_large_log(tmp_path):
+    """mmap 대상인 큰 로그에서도 ASCII/한글 표기를 인식한다"""
+    # Given
+    padding = 'x' * (_MMAP_MIN_SIZE + 1)
+    (tmp_path / 'test-results.md').write_text(
+        f'{padding}\n42개 통과\n1 failed\ncoverage: 91.5%\n',
+        encoding='utf-8',
+    )
+
+    # When
+    metrics = build_test_metrics(tmp_path)
+
+    # Then
+    assert metrics['tests_passed'] == 42
+    assert metrics['tests_failed'] == 1
+    assert metrics['coverage_percent'] == 91.5
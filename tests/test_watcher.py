@@ -0,0 +1,115 @@
+"""FileWaitHelper 이벤트 기반 대기 테스트."""
+
+import builtins
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('watchdog')
+
+from orchestrator import watcher
+from orchestrator.watcher import FileWaitHelper
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    """watcher 모듈 안에서 대상 파일을 open()한 횟수를 센다."""
+    counts = {}
+    real_open = builtins.open
+
+    def counting_open(file, *args, **kwargs):
+        counts[str(file)] = counts.get(str(file), 0) + 1
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(watcher, 'open', counting_open, raising=False)
+    return counts
+
+
+def test_wait_for_file_content_does_not_spin_on_unchanged_file(tmp_path, count_reads):
+    """키가 없는 파일을 기다리는 동안 자기 자신의 읽기 이벤트로 깨어나지 않는다"""
+    # Given
+    decision = tmp_path / 'checkpoint-decision.json'
+    decision.write_text('{"partial": true}')
+
+    # When
+    result = FileWaitHelper.wait_for_file_content(decision, 'action', timeout=1.0)
+
+    # Then
+    assert result is None
+    assert count_reads.get(str(decision), 0) <= 3
+
+
+def test_wait_for_file_content_wakes_on_write(tmp_path):
+    """파일에 키가 기록되면 재확인 간격을 기다리지 않고 바로 반환한다"""
+    # Given
+    decision = tmp_path / 'checkpoint-decision.json'
+    decision.write_text('{}')
+    timer = threading.Timer(
+        0.2, decision.write_text, args=('{"action": "approve"}',)
+    )
+
+    # When
+    timer.start()
+    try:
+        result = FileWaitHelper.wait_for_file_content(decision, 'action', timeout=3.0)
+    finally:
+        timer.cancel()
+
+    # Then
+    assert result == {'action': 'approve'}
+
+
+def test_wait_for_file_wakes_on_creation(tmp_path):
+    """파일이 생성되면 재확인 간격(5초)을 기다리지 않고 바로 반환한다"""
+    # Given
+    target = tmp_path / 'plan-done.json'
+    timer = threading.Timer(0.2, target.write_text, args=('{}',))
+
+    # When
+    timer.start()
+    try:
+        started = time.monotonic()
+        created = FileWaitHelper.wait_for_file(target, timeout=3.0)
+        elapsed = time.monotonic() - started
+    finally:
+        timer.cancel()
+
+    # Then
+    assert created is True
+    assert elapsed < 2.0
+
+
+def test_wait_for_file_ignores_unrelated_events(tmp_path, monkeypatch):
+    """다른 파일의 읽기/삭제 이벤트로는 존재 여부를 다시 확인하지 않는다"""
+    # Given
+    target = tmp_path / 'plan-done.json'
+    sibling = tmp_path / 'other.json'
+    sibling.write_text('{}')
+    checks = []
+    real_exists = watcher.os.path.exists
+
+    def counting_exists(path):
+        if path == str(target):
+            checks.append(path)
+        return real_exists(path)
+
+    monkeypatch.setattr(watcher.os.path, 'exists', counting_exists)
+
+    def touch_sibling():
+        for _ in range(50):
+            sibling.read_text()
+        sibling.unlink()
+
+    timer = threading.Timer(0.1, touch_sibling)
+
+    # When
+    timer.start()
+    try:
+        created = FileWaitHelper.wait_for_file(target, timeout=0.5)
+    finally:
+        timer.cancel()
+
+    # Then
+    assert created is False
+    assert len(checks) <= 3